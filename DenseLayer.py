@@ -0,0 +1,71 @@
+import numpy as np
+
+from Node import Node, rng
+
+
+class DenseLayer:
+
+    def __init__(self, nodes: list):
+        """
+        :param nodes: the nodes in this layer (all with the same number of inputs)
+        """
+
+        # the nodes are kept so they can still be mutated, copied and written to json one by one
+        self.nodes = nodes
+
+        # stacks the weights and biases of every node into one matrix (number of nodes x number of inputs)
+        # the matrices own the data, one contiguous block per layer instead of one small array per node
+        self.weights = np.stack([node.weights for node in nodes])
+        self.biases = np.stack([node.biases for node in nodes])
+
+        # each node's weights and biases are set to a row (view) of these matrices
+        # mutating a node therefore changes the matrices as well, the matrices are never copied
+        for row, node in enumerate(nodes):
+            node.weights = self.weights[row]
+            node.biases = self.biases[row]
+
+        # the sigmoid value of each node, applied to the matching row
+        self.sigmoidValues = np.array([node.sigmoid_value for node in nodes], dtype=np.float32)
+
+        # buffers that are reused every time the layer is called, instead of creating new arrays each call
+        # values holds the output of the layer, it is overwritten by the next call
+        self.biasSums = np.empty(len(nodes), dtype=np.float32)
+        self.values = np.empty(len(nodes), dtype=np.float32)
+
+    def mutate(self):
+        """
+        Mutates every node in this layer (same as calling mutate on each node)
+        """
+
+        # mutating the weights of every node by a random amount within -max and max
+        # one random change for each weight, applied to the whole matrix at once
+        self.weights *= 1 - rng.uniform(-Node.MAX_MUTATION, Node.MAX_MUTATION, self.weights.shape)
+
+        # mutating the biases of every node by a random amount within -max and max
+        self.biases *= 1 - rng.uniform(-Node.MAX_MUTATION, Node.MAX_MUTATION, self.biases.shape)
+
+        # returning the mutated layer
+        return self
+
+    def __call__(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        :param inputs: array of outputs from the previous layer (or the network inputs)
+        :return: array with the value of every node in this layer (self.values, overwritten by the next call)
+        """
+
+        # this is the same as calling each node in the layer with the list of inputs
+        # the whole layer is computed with one matrix multiplication instead of a call per node
+        # every step writes into the preallocated buffers (out=, +=, *=), so no new arrays are created
+        np.matmul(self.weights, inputs, out=self.values)
+        np.sum(self.biases, axis=1, out=self.biasSums)
+        self.values += self.biasSums
+
+        # applies the sigmoid activation function of every node (same as Node.sigmoidActivationFunction)
+        # 0.5 * (1 + tanh(0.5 * c * x)), the tanh form does not overflow, so no clipping is needed
+        self.values *= self.sigmoidValues
+        self.values *= 0.5
+        np.tanh(self.values, out=self.values)
+        self.values += 1
+        self.values *= 0.5
+
+        return self.values
@@ -1,6 +1,9 @@
 from Node import randomNode
+from DenseLayer import DenseLayer
 from copy import deepcopy
 
+import numpy as np
+
 
 class NeuralNetwork:
 
@@ -34,6 +37,10 @@ class NeuralNetwork:
             for node in parents:
                 node.setChildren(children)
 
+        # each layer stores the weights and biases of its nodes as matrices
+        # this is what is used when the network is called
+        self.layers = [DenseLayer(layer) for layer in self.nodes]
+
         # setting instance variables
         self.numInputs = numInputs
         self.nodesInLayer = nodesInLayer
@@ -51,11 +58,11 @@ class NeuralNetwork:
         #     for nodeNumber in range(self.nodesInLayer):
         #         self.nodes[layerNumber][nodeNumber].mutate()
 
-        # this is just a compressed version of the two-dimensional for loop above
-        # it would call node.mutate() for each node in self.nodes
-        # this uses two maps to iterate faster
-        # casting to a list is needed (for some reason, I'm not entirely sure)
-        list(map(lambda layer: list(map(lambda node: node.mutate(), layer)), self.nodes))
+        # this does the same as the two-dimensional for loop above
+        # each layer mutates its whole weight and bias matrices at once instead of calling each node
+        # the nodes' weights and biases are views of these matrices, so the nodes are mutated as well
+        for layer in self.layers:
+            layer.mutate()
 
         # returning the mutated neural network
         return self
@@ -70,16 +77,13 @@ class NeuralNetwork:
         if len(inputs) != self.numInputs:
             raise ValueError("Wrong number of inputs.")
 
-        for layer in self.nodes:
-            # these are the outputs to be passed into the next function
-            newInputs = []
-
-            for node in layer:
-                # call each node with the list of inputs
-                newInputs.append(node(inputs))
+        # the layer matrices are float32, the inputs are converted to match
+        # otherwise numpy would compute every layer in float64
+        inputs = np.asarray(inputs, dtype=np.float32)
 
+        for layer in self.layers:
             # sets the inputs for the next layer to be the results of the current
-            inputs = newInputs
+            inputs = layer(inputs)
 
         # these are the values for the last layer
         outputValues = inputs
@@ -87,7 +91,7 @@ class NeuralNetwork:
         # returns the sum of all values in the last layer
         # this could be turned into some other function to create multiple outputs
         # sets this output as the value for self
-        self.value = sum(outputValues)
+        self.value = float(np.sum(outputValues))
 
         # returns the calculated value
         return self.value
@@ -1,5 +1,10 @@
-from math import e
-from random import uniform
+from math import tanh
+
+import numpy as np
+
+# random number generator used to create and mutate the weights and biases of nodes
+# generates a whole array of random numbers in one call
+rng = np.random.default_rng()
 
 
 class Node:
@@ -31,8 +36,10 @@ class Node:
             raise ValueError("Different amount of weights and biases.")
 
         # these are part of the function that is applied when this node is called
-        self.weights = weights
-        self.biases = biases
+        # stored as numpy arrays so the weighted sum is computed in one vectorized call
+        # float32 is precise enough for weights and halves the memory compared to float64
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.biases = np.asarray(biases, dtype=np.float32)
 
         # a list of all the attached nodes
         self.children = children
@@ -51,14 +58,12 @@ class Node:
         """
 
         # mutating the weights by a random amount within -max and max
-        for index in range(len(self.weights)):
-            change = uniform(-self.MAX_MUTATION, self.MAX_MUTATION)
-            self.weights[index] *= (1 - change)
+        # one random change for each weight, applied to all weights at once
+        # this is done in place, so the layer matrix the weights are a view of is changed as well
+        self.weights *= 1 - rng.uniform(-self.MAX_MUTATION, self.MAX_MUTATION, self.weights.shape)
 
         # mutating the biases by a random amount within -max and max
-        for index in range(len(self.biases)):
-            change = uniform(-self.MAX_MUTATION, self.MAX_MUTATION)
-            self.biases[index] *= (1 - change)
+        self.biases *= 1 - rng.uniform(-self.MAX_MUTATION, self.MAX_MUTATION, self.biases.shape)
 
         # returning the mutated node
         return self
@@ -86,9 +91,25 @@ class Node:
         :return: one of descendents, no matter how deep
         """
 
-        # first checks whether this other is in the children list
-        # if it is not in its children list, it checks whether it is connected to any of the children
-        return self.isInChildren(other) or any(map(lambda child: child.isConnectedTo(other), self.children))
+        # walks through all descendents with a stack instead of recursing into each child
+        # every layer shares the same children list, so a recursive search would visit the same nodes many times
+        # seen keeps track of the visited nodes so each node is only visited once
+        seen = {id(self)}
+        stack = list(self.children)
+
+        while stack:
+            node = stack.pop()
+
+            if node is other:
+                return True
+
+            if id(node) in seen:
+                continue
+
+            seen.add(id(node))
+            stack.extend(node.children)
+
+        return False
 
     def outputWithoutSigmoid(self, nums: list[float]) -> float:
         """
@@ -101,7 +122,9 @@ class Node:
         # this is passed into a sigmoid activation function
         # do not explicitly call this function
 
-        return sum(map(lambda num, weight, bias: num * weight + bias, nums, self.weights, self.biases))
+        # the sum of weight * num + bias is the dot product of weights and nums plus the sum of the biases
+        # np.dot dispatches to BLAS instead of building a temporary array for every call
+        return float(np.dot(self.weights, nums) + np.sum(self.biases))
 
     def sigmoidActivationFunction(self, num: float) -> float:
         """
@@ -113,9 +136,9 @@ class Node:
         # this squashes it between 0-1
         # do not explicitly call this function
 
-        # to prevent overflows, keep within a certain range
-        value = min(100.0, max(-100.0, self.sigmoid_value * num))
-        return 1 / (1 + e ** -value)
+        # 1 / (1 + e^-x) is the same as 0.5 * (1 + tanh(x / 2))
+        # tanh does not overflow for large inputs, so the value does not need to be kept within a range
+        return 0.5 * (1 + tanh(0.5 * self.sigmoid_value * num))
 
     def __call__(self, nums: list[float]) -> float:
         """
@@ -136,13 +159,12 @@ class Node:
         :return: the copied node object
         """
 
-        # creating copy of weight through list comprehension
-        # because weights are floats, do not need to copy weights
-        weightsCopy = [weight for weight in self.weights]
+        # creating copy of weights (a single memory copy of the numpy array)
+        # this also detaches the copy from the layer matrix the weights may be a view of
+        weightsCopy = self.weights.copy()
 
-        # creating copy of biases through list comprehension
-        # because biases are floats, do not need to copy biases
-        biasesCopy = [bias for bias in self.biases]
+        # creating copy of biases (a single memory copy of the numpy array)
+        biasesCopy = self.biases.copy()
 
         # returning the copied node
         # does not change the children list
@@ -154,7 +176,8 @@ class Node:
         """
 
         # keys are weights and biases
-        return {"Weights": self.weights, "Biases": self.biases}
+        # numpy arrays are not json serializable, so they are converted to lists
+        return {"Weights": self.weights.tolist(), "Biases": self.biases.tolist()}
 
 
 def randomNode(numInputs: int) -> Node:
@@ -165,11 +188,11 @@ def randomNode(numInputs: int) -> Node:
 
     # create a list with a random weight (in the range of Min/Max weights)
     # length of list is numInputs
-    randomWeights = [uniform(Node.MIN_WEIGHT, Node.MAX_WEIGHT) for _ in range(numInputs)]
+    randomWeights = rng.uniform(Node.MIN_WEIGHT, Node.MAX_WEIGHT, numInputs).astype(np.float32)
 
     # creates a list with random biases (in the range of Min/Max biases)
     # length of list is numInputs
-    randomBiases = [uniform(Node.MIN_BIAS, Node.MAX_BIAS) for _ in range(numInputs)]
+    randomBiases = rng.uniform(Node.MIN_BIAS, Node.MAX_BIAS, numInputs).astype(np.float32)
 
     # uses default sigmoid value
     defaultSigmoid = Node.DEFAULT_SIGMOID_VALUE
@@ -83,13 +83,16 @@ class Population:
         self.individuals.append(best)
 
     def evolve(self, inputs: list[float], goal: float, numIterations: int,
-               writeToJson: bool = False, jsonFilename: str = "bestInPopulation"):
+               writeToJson: bool = False, jsonFilename: str = "bestInPopulation",
+               verbose: bool = False, printEvery: int = 5):
         """
         :param inputs:
         :param goal:
         :param numIterations:
         :param writeToJson: whether to output in a json or not
         :param jsonFilename: name of file to output data to
+        :param verbose: whether to print the value of the best individual
+        :param printEvery: how many generations between each print (only used if verbose)
         :return: nothing
         """
 
@@ -102,13 +105,23 @@ class Population:
             # it calls the inputs on the population
             # this calls each individual in the population
             # this also sets self.values
-            self(inputs)
+            if generationNumber == 0:
+                self(inputs)
+
+            # after the first generation, the last individual is the best of the previous generation
+            # it was not mutated and the inputs are the same, so its value is already known
+            # only the new (mutated) individuals need to be called
+            else:
+                self.values = [individual(inputs) for individual in self.individuals[:-1]]
+                self.values.append(self.individuals[-1].value)
 
             # finds the best individual in the population
             best = self.findBest(goal)
 
             # printing the value of the best (not necessary)
-            print(f"Best is: {best.value}")
+            # printing every generation is slow compared to a generation itself, so it is only done every printEvery
+            if verbose and generationNumber % printEvery == 0:
+                print(f"Best is: {best.value}")
 
             # adding the best in current generation
             # dictionary will always be created. your python compiler may give a warning here
@@ -32,7 +32,8 @@ def main():
     print(f"Goal is: {goal}\n")
 
     # calls evolve to create the best set of weights
-    population.evolve(inputs, goal, numIterations, writeToJson=True)
+    # prints the best of every generation
+    population.evolve(inputs, goal, numIterations, writeToJson=True, verbose=True, printEvery=1)
 
 
 if __name__ == '__main__':